@@ -6,10 +6,14 @@ This agent handles the critical connection between Odoo and the WooCommerce onli
 
 import os
 import sys
-import json
+import re
+import asyncio
 import logging
-from github import Github
-from datetime import datetime
+import httpx
+import orjson
+from types import MappingProxyType
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 # Setup logging
 logging.basicConfig(
@@ -17,62 +21,87 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+API_URL = 'https://api.github.com'
+RESPONSE_SENTINEL = 'WooCommerce Sync Coordinator'
+
+# Comment posting is network-bound, so up to this many posts are kept in flight
+COMMENT_WORKERS = 8
+
+# Rate-limited and transient failures are retried this many times. Server errors
+# are only retried for idempotent calls: GitHub may have created a comment before
+# answering 502/504, whereas rate-limited requests are never processed.
+API_RETRIES = 3
+SERVER_ERROR_STATUSES = (502, 503, 504)
+
+# A request gives up rather than wait longer than this in total, so a sleeping
+# run never overlaps the next scheduled one; a failed comment post is retried
+# on a later run
+MAX_RETRY_WAIT = 300
+
+# Every call goes to api.github.com, so requests share multiplexed HTTP/2
+# connections from one pool for the whole run
+HTTP_POOL_SIZE = 16
+
+# (repo, issue number) pairs we have responded to, and those whose response
+# failed to post, kept between runs
+RESPONDED_CACHE = os.environ.get('RESPONDED_CACHE', '.responded.json')
+
+# Issues are listed newest first; after this many cached issues in a row the
+# rest were handled by earlier runs and are not paginated. Stopping early would
+# strand an older issue whose post failed, so the scan keeps going until every
+# failed issue has been seen again.
+CACHED_RUN_LIMIT = 20
+
+# One round-trip returns a page of open issues together with their comments,
+# so deciding whether we already responded needs no per-issue REST calls.
+# Our response is either among the oldest comments or among the newest, so the
+# first 100 and the last 30 are fetched.
+ISSUE_FIELDS = """
+fragment IssueFields on Issue {
+  number
+  title
+  body
+  repository { nameWithOwner }
+  comments(first: 100) {
+    nodes { bodyText }
+  }
+  recentComments: comments(last: 30) {
+    nodes { bodyText }
+  }
+}
+"""
 
-class WooCommerceSyncCoordinator:
-    def __init__(self):
-        self.github_token = os.environ.get('GITHUB_TOKEN')
-        self.cross_repo_token = os.environ.get('CROSS_REPO_TOKEN', self.github_token)
-        self.module_path = '/home/jason/odoo17_custom_addons/integration_woocommerce'
-        
-        # Module capabilities based on code analysis
-        self.module_info = {
-            'type': 'Commercial module from VentorTech',
-            'dependencies': ['integration', 'queue_job', 'sale_management'],
-            'architecture': 'Job queue-based asynchronous processing',
-            'key_features': {
-                'products': 'Bidirectional sync with variant support',
-                'orders': 'Real-time webhook import',
-                'inventory': 'Stock level synchronization',
-                'customers': 'B2B/B2C customer management'
-            }
-        }
-        
-        # Paint business context
-        self.business_context = {
-            'products': 'Paint products with color variants and sizes',
-            'formulas': 'Tikkurila formulas must sync correctly',
-            'customers': 'B2B paint shops and B2C consumers',
-            'inventory': 'Critical for paint availability'
-        }
-    
-    def analyze_request(self, issue_title, issue_body):
-        """Analyze requests and provide WooCommerce-specific guidance"""
-        title_lower = issue_title.lower()
-        body_lower = issue_body.lower()
-        
-        # Product sync questions
-        if any(word in title_lower + ' ' + body_lower for word in ['product', 'sync', 'variant', 'color']):
-            return self.handle_product_sync_request(issue_title, issue_body)
-        
-        # Order/webhook questions
-        elif any(word in title_lower + ' ' + body_lower for word in ['order', 'webhook', 'real-time']):
-            return self.handle_order_sync_request(issue_title, issue_body)
-        
-        # Job queue questions
-        elif any(word in title_lower + ' ' + body_lower for word in ['job', 'queue', 'async', 'background']):
-            return self.handle_job_queue_request(issue_title, issue_body)
-        
-        # Configuration questions
-        elif any(word in title_lower + ' ' + body_lower for word in ['config', 'setup', 'webhook', 'api']):
-            return self.handle_configuration_request(issue_title, issue_body)
-        
-        # General request
-        else:
-            return self.general_response(issue_title)
-    
-    def handle_product_sync_request(self, title, body):
-        """Guide product synchronization setup"""
-        return f"""## 🛒 WooCommerce Sync Coordinator Response - Product Synchronization
+OPEN_ISSUES_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(states: OPEN, first: 100, after: $cursor, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { ...IssueFields }
+    }
+  }
+}
+""" + ISSUE_FIELDS
+
+SEARCH_ISSUES_QUERY = """
+query($query: String!, $cursor: String) {
+  search(query: $query, type: ISSUE, first: 100, after: $cursor) {
+    pageInfo { hasNextPage endCursor }
+    nodes { ...IssueFields }
+  }
+}
+""" + ISSUE_FIELDS
+
+# Server-side prefilter for the monitored repos. GitHub search allows at most
+# five OR operators, so 'sync' and 'commerce' stand in for the longer phrases
+# and scan_monitored_repos applies the exact keyword pattern afterwards.
+CROSS_REPO_SEARCH = 'is:issue is:open in:title,body sort:created-desc woocommerce OR ecommerce OR commerce OR "online store" OR webhook OR sync'
+
+# Response templates, built once at import. {module_path} is filled in once per
+# coordinator and {title} by concatenation, so no response is formatted per call.
+_TPL_PRODUCT = """## 🛒 WooCommerce Sync Coordinator Response - Product Synchronization
 
 I'll help you set up product synchronization between Odoo and WooCommerce.
 
@@ -86,7 +115,7 @@ I'll help you set up product synchronization between Odoo and WooCommerce.
 
 2. **Synchronization Process**
    ```python
-   # Module location: {self.module_path}
+   # Module location: {module_path}
    # Process flow:
    # 1. Configure field mappings
    # 2. Set sync direction (Odoo→WC, WC→Odoo, or both)
@@ -122,10 +151,8 @@ I'll help you set up product synchronization between Odoo and WooCommerce.
 
 ---
 *Synchronizing paint products between Odoo and online store*"""
-    
-    def handle_order_sync_request(self, title, body):
-        """Handle order synchronization queries"""
-        return f"""## 🛒 WooCommerce Sync Coordinator Response - Order Management
+
+_TPL_ORDER = """## 🛒 WooCommerce Sync Coordinator Response - Order Management
 
 ### Order Synchronization Features:
 
@@ -177,10 +204,8 @@ I'll help you set up product synchronization between Odoo and WooCommerce.
 
 ---
 *Ensuring paint orders flow seamlessly from web to warehouse*"""
-    
-    def handle_job_queue_request(self, title, body):
-        """Explain job queue functionality"""
-        return f"""## 🛒 WooCommerce Sync Coordinator Response - Job Queue System
+
+_TPL_JOB_QUEUE = """## 🛒 WooCommerce Sync Coordinator Response - Job Queue System
 
 ### Understanding the Job Queue Architecture:
 
@@ -236,10 +261,8 @@ I'll help you set up product synchronization between Odoo and WooCommerce.
 
 ---
 *Asynchronous processing for reliable e-commerce integration*"""
-    
-    def handle_configuration_request(self, title, body):
-        """Guide module configuration"""
-        return f"""## 🛒 WooCommerce Sync Coordinator Response - Configuration Guide
+
+_TPL_CONFIGURATION = """## 🛒 WooCommerce Sync Coordinator Response - Configuration Guide
 
 ### Initial Setup Steps:
 
@@ -300,10 +323,8 @@ I'll help you set up product synchronization between Odoo and WooCommerce.
 
 ---
 *Configuring reliable paint product synchronization*"""
-    
-    def general_response(self, title):
-        """General response for other queries"""
-        return f"""## 🛒 WooCommerce Sync Coordinator Response
+
+_TPL_GENERAL = """## 🛒 WooCommerce Sync Coordinator Response
 
 I manage the integration between Odoo and WooCommerce for the paint business.
 
@@ -347,64 +368,358 @@ How can I help with your specific WooCommerce integration need?
 
 ---
 *E-commerce integration for paint manufacturing excellence*"""
+_TPL_GENERAL_HEAD, _TPL_GENERAL_TAIL = _TPL_GENERAL.split('{title}')
+
+class WooCommerceSyncCoordinator:
+    __slots__ = ('github_token', 'cross_repo_token', 'module_path', '_resp_product',
+                 'responded', 'failed', 'client')
+    
+    # Keyword groups for analyze_request, each matched in a single regex pass over
+    # the lowercased issue text. Keywords must not touch other letters, which keeps
+    # 'order' out of 'disorder' but still matches identifiers like 'queue_job' and
+    # 'order_id'. Stems cover inflections such as 'synchronizing'.
+    _RE_PRODUCT = re.compile(r'(?<![a-z])(?:products?|sync[a-z]*|variants?|colou?rs?)(?![a-z])')
+    _RE_ORDER = re.compile(r'(?<![a-z])(?:orders?|webhooks?|real-time)(?![a-z])')
+    _RE_JOB_QUEUE = re.compile(r'(?<![a-z])(?:jobs?|queue[a-z]*|async[a-z]*|background)(?![a-z])')
+    _RE_CONFIGURATION = re.compile(r'(?<![a-z])(?:config[a-z]*|setup|webhooks?|api)(?![a-z])')
+    
+    # Mentions that make an issue in a monitored repo ours to answer
+    _RE_MONITOR = re.compile(r'(?<![a-z])(?:woocommerce|e-?commerce|online store|webhooks?'
+                             r'|shop sync|product sync)(?![a-z])')
+    
+    # Module capabilities based on code analysis
+    MODULE_INFO = MappingProxyType({
+        'type': 'Commercial module from VentorTech',
+        'dependencies': ('integration', 'queue_job', 'sale_management'),
+        'architecture': 'Job queue-based asynchronous processing',
+        'key_features': MappingProxyType({
+            'products': 'Bidirectional sync with variant support',
+            'orders': 'Real-time webhook import',
+            'inventory': 'Stock level synchronization',
+            'customers': 'B2B/B2C customer management'
+        })
+    })
+    
+    # Paint business context
+    BUSINESS_CONTEXT = MappingProxyType({
+        'products': 'Paint products with color variants and sizes',
+        'formulas': 'Tikkurila formulas must sync correctly',
+        'customers': 'B2B paint shops and B2C consumers',
+        'inventory': 'Critical for paint availability'
+    })
+    
+    # Other repos monitored for WooCommerce/e-commerce requests
+    REPOS_TO_MONITOR = (
+        'jayo2005/paint-odoo-operations',
+        'jayo2005/paint-project-orchestration',
+        'jayo2005/paint-wordpress-operations'
+    )
+    
+    def __init__(self):
+        self.github_token = os.environ.get('GITHUB_TOKEN')
+        self.cross_repo_token = os.environ.get('CROSS_REPO_TOKEN', self.github_token)
+        self.module_path = '/home/jason/odoo17_custom_addons/integration_woocommerce'
+        self._resp_product = _TPL_PRODUCT.format_map({'module_path': self.module_path})
+        self.responded, self.failed = self.load_responded()
+        self.client = None
+    
+    def analyze_request(self, issue_title, issue_body, blob=None):
+        """Analyze requests and provide WooCommerce-specific guidance
+        
+        blob is the lowercased "title body" text when the caller already has it.
+        """
+        issue_title = issue_title or ''
+        text = blob if blob is not None else (issue_title + ' ' + (issue_body or '')).lower()
+        
+        # Product sync questions
+        if self._RE_PRODUCT.search(text):
+            return self.handle_product_sync_request(issue_title, issue_body)
+        
+        # Order/webhook questions
+        elif self._RE_ORDER.search(text):
+            return self.handle_order_sync_request(issue_title, issue_body)
+        
+        # Job queue questions
+        elif self._RE_JOB_QUEUE.search(text):
+            return self.handle_job_queue_request(issue_title, issue_body)
+        
+        # Configuration questions
+        elif self._RE_CONFIGURATION.search(text):
+            return self.handle_configuration_request(issue_title, issue_body)
+        
+        # General request
+        else:
+            return self.general_response(issue_title)
+    
+    def handle_product_sync_request(self, title, body):
+        """Guide product synchronization setup"""
+        return self._resp_product
+    
+    def handle_order_sync_request(self, title, body):
+        """Handle order synchronization queries"""
+        return _TPL_ORDER
+    
+    def handle_job_queue_request(self, title, body):
+        """Explain job queue functionality"""
+        return _TPL_JOB_QUEUE
     
-    def process_issues(self):
+    def handle_configuration_request(self, title, body):
+        """Guide module configuration"""
+        return _TPL_CONFIGURATION
+    
+    def general_response(self, title):
+        """General response for other queries"""
+        return _TPL_GENERAL_HEAD + title + _TPL_GENERAL_TAIL
+    
+    async def process_issues(self):
         """Process GitHub issues requiring WooCommerce expertise"""
         try:
             if not self.github_token:
                 logger.error("GITHUB_TOKEN not set")
                 return
             
-            g = Github(self.github_token)
-            cross_g = Github(self.cross_repo_token)
+            async with self.build_client() as client:
+                self.client = client
+                
+                # Both scans are independent round-trip chains, so run them side by side.
+                # Responses are collected first and posted concurrently at the end.
+                home, monitored = await asyncio.gather(self.scan_home_repo(),
+                                                       self.scan_monitored_repos())
+                semaphore = asyncio.Semaphore(COMMENT_WORKERS)
+                await asyncio.gather(*(self.post_comment(pending, semaphore)
+                                       for pending in home + monitored))
             
-            # Check our own repository
-            repo = g.get_repo('jayo2005/paint-woocommerce-operations')
-            for issue in repo.get_issues(state='open'):
-                if not self.already_responded(issue):
-                    response = self.analyze_request(issue.title, issue.body)
-                    issue.create_comment(response)
-                    logger.info(f"Responded to issue #{issue.number}")
+            # Also records responses found while scanning comments
+            self.save_responded()
+        
+        except Exception as e:
+            logger.exception("Agent error: %s", e)
+        finally:
+            self.client = None
+    
+    async def scan_home_repo(self):
+        """Collect responses for open issues in our own repository"""
+        pending = []
+        repo_name = 'jayo2005/paint-woocommerce-operations'
+        try:
+            async for item in self.uncached(self.fetch_open_issues(repo_name, self.github_token),
+                                            (repo_name,)):
+                if not self.already_responded(item):
+                    response = self.analyze_request(item['title'], item['body'], item['blob'])
+                    pending.append((self.github_token, (item['repo'], item['number']), response,
+                                    f"issue #{item['number']}"))
+        except Exception as e:
+            logger.error(f"Error monitoring {repo_name}: {str(e)}")
+        return pending
+    
+    async def scan_monitored_repos(self):
+        """Collect responses for WooCommerce/e-commerce requests in other repos"""
+        pending = []
+        search = ' '.join([CROSS_REPO_SEARCH] + [f'repo:{name}' for name in self.REPOS_TO_MONITOR])
+        try:
+            async for item in self.uncached(self.search_open_issues(search, self.cross_repo_token),
+                                            self.REPOS_TO_MONITOR):
+                # Check if issue mentions WooCommerce or e-commerce
+                if self._RE_MONITOR.search(item['blob']):
+                    if not self.already_responded(item):
+                        response = self.analyze_request(item['title'], item['body'], item['blob'])
+                        pending.append((self.cross_repo_token, (item['repo'], item['number']), response,
+                                        f"{item['repo']} issue #{item['number']}"))
+        except Exception as e:
+            logger.error(f"Error monitoring {', '.join(self.REPOS_TO_MONITOR)}: {str(e)}")
+        return pending
+    
+    async def post_comment(self, pending, semaphore):
+        """Post a response and record it in the responded cache"""
+        token, (repo_name, number), response, label = pending
+        async with semaphore:
+            try:
+                await self.request('POST', f"/repos/{repo_name}/issues/{number}/comments", token,
+                                   payload={'body': response}, idempotent=False)
+            except httpx.HTTPError as e:
+                logger.error(f"Error responding to {label}: {str(e)}")
+                self.failed.add((repo_name, number))
+                self.save_responded()
+                return False
+        logger.info(f"Responded to {label}")
+        self.responded.add((repo_name, number))
+        self.failed.discard((repo_name, number))
+        self.save_responded()
+        return True
+    
+    def build_client(self):
+        """Create the shared HTTP/2 client for all GitHub calls"""
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_connections=HTTP_POOL_SIZE)
+        )
+        return httpx.AsyncClient(
+            base_url=API_URL,
+            transport=transport,
+            headers={'Accept': 'application/vnd.github+json'},
+            timeout=30
+        )
+    
+    async def request(self, method, url, token, payload=None, params=None, idempotent=True):
+        """Send a GitHub API request, backing off on rate limits and transient errors"""
+        headers = {'Authorization': f'Bearer {token}'}
+        content = None
+        if payload is not None:
+            headers['Content-Type'] = 'application/json'
+            content = orjson.dumps(payload)
+        waited = 0
+        for attempt in range(API_RETRIES + 1):
+            resp = await self.client.request(method, url, headers=headers, content=content,
+                                             params=params)
+            # A 403 is only a rate limit when GitHub says so in the headers
+            rate_limited = resp.status_code == 429 or (resp.status_code == 403 and (
+                'retry-after' in resp.headers or resp.headers.get('x-ratelimit-remaining') == '0'))
+            retryable = rate_limited or (idempotent and resp.status_code in SERVER_ERROR_STATUSES)
+            if attempt == API_RETRIES or not retryable:
+                resp.raise_for_status()
+                return orjson.loads(resp.content)
+            delay = self.retry_delay(resp, attempt) if rate_limited else 2 ** attempt
+            if waited + delay > MAX_RETRY_WAIT:
+                logger.warning(f"GitHub returned {resp.status_code} for {url}, "
+                               f"not waiting {delay:.0f}s to retry")
+                resp.raise_for_status()
+            logger.warning(f"GitHub returned {resp.status_code} for {url}, retrying in {delay:.0f}s")
+            await asyncio.sleep(delay)
+            waited += delay
+    
+    def retry_delay(self, resp, attempt):
+        """Seconds to wait before retrying a rate-limited request, as GitHub advises"""
+        retry_after = resp.headers.get('retry-after')
+        if retry_after:
+            if retry_after.isdigit():
+                return int(retry_after)
+            try:
+                # Retry-After may also be an HTTP-date
+                until = parsedate_to_datetime(retry_after)
+                if until.tzinfo is None:
+                    # A '-0000' zone parses as naive; HTTP-dates are always UTC
+                    until = until.replace(tzinfo=timezone.utc)
+                return max(0, (until - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+        reset = resp.headers.get('x-ratelimit-reset', '')
+        if resp.headers.get('x-ratelimit-remaining') == '0' and reset.isdigit():
+            # Primary rate limit is exhausted - wait for the window to reset
+            return max(0, int(reset) - datetime.now(timezone.utc).timestamp()) + 1
+        # Secondary limits without a hint ask for at least a minute
+        return 60 * 2 ** attempt
+    
+    def fetch_open_issues(self, repo_name, token):
+        """Fetch a repository's open issues with their response status"""
+        owner, name = repo_name.split('/')
+        return self.fetch_issue_pages(OPEN_ISSUES_QUERY, {'owner': owner, 'name': name},
+                                      token, 'repository', 'issues')
+    
+    def search_open_issues(self, search, token):
+        """Fetch open issues matching a GitHub search with their response status"""
+        return self.fetch_issue_pages(SEARCH_ISSUES_QUERY, {'query': search}, token, 'search')
+    
+    async def fetch_issue_pages(self, query, variables, token, *path):
+        """Yield issues from a paginated query, fetching each page only when it is reached"""
+        cursor = None
+        while True:
+            payload = await self.request('POST', '/graphql', token, payload={
+                'query': query, 'variables': {**variables, 'cursor': cursor}
+            })
+            if payload.get('errors'):
+                raise RuntimeError(f"GraphQL error: {payload['errors']}")
             
-            # Monitor other repos for WooCommerce/e-commerce requests
-            repos_to_monitor = [
-                'jayo2005/paint-odoo-operations',
-                'jayo2005/paint-project-orchestration',
-                'jayo2005/paint-wordpress-operations'
-            ]
+            page = payload['data']
+            for key in path:
+                page = page[key]
+            for node in page['nodes']:
+                # Issues can be created without a description; there is nothing to answer
+                # when both title and body are empty
+                title = node['title'] or ''
+                body = node['body'] or ''
+                if not (title or body):
+                    continue
+                
+                comments = node['comments']['nodes'] + node['recentComments']['nodes']
+                responded = any(RESPONSE_SENTINEL in comment['bodyText'][:64]
+                                for comment in comments)
+                yield {
+                    'repo': node['repository']['nameWithOwner'],
+                    'number': node['number'],
+                    'title': title,
+                    'body': body,
+                    'blob': (title + ' ' + body).lower(),
+                    'responded': responded
+                }
             
-            for repo_name in repos_to_monitor:
-                try:
-                    other_repo = cross_g.get_repo(repo_name)
-                    for issue in other_repo.get_issues(state='open'):
-                        # Check if issue mentions WooCommerce or e-commerce
-                        if any(keyword in issue.title.lower() + ' ' + issue.body.lower() 
-                               for keyword in ['woocommerce', 'ecommerce', 'e-commerce', 'online store', 
-                                               'webhook', 'shop sync', 'product sync']):
-                            if not self.already_responded(issue):
-                                response = self.analyze_request(issue.title, issue.body)
-                                issue.create_comment(response)
-                                logger.info(f"Responded to {repo_name} issue #{issue.number}")
-                except Exception as e:
-                    logger.error(f"Error monitoring {repo_name}: {str(e)}")
+            if not page['pageInfo']['hasNextPage']:
+                return
+            cursor = page['pageInfo']['endCursor']
+    
+    async def uncached(self, issues, repos):
+        """Yield issues missing from the responded cache, stopping after a long run of hits"""
+        # Earlier failed posts in these repos must be reached again before stopping
+        outstanding = {key for key in self.failed if key[0] in repos}
+        seen = set()
+        cached_run = 0
+        async for item in issues:
+            key = (item['repo'], item['number'])
+            seen.add(key)
+            outstanding.discard(key)
+            if key in self.responded:
+                cached_run += 1
+                if cached_run >= CACHED_RUN_LIMIT and not outstanding:
+                    return
+            else:
+                cached_run = 0
+                yield item
         
-        except Exception as e:
-            logger.error(f"Agent error: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+        # Whole listing seen - cached or failed issues still missing were closed or no
+        # longer match, so drop them to keep the cache bounded by the open issues.
+        # Should one reappear, the GraphQL comment check still finds our response.
+        self.failed -= outstanding
+        self.responded -= {key for key in self.responded if key[0] in repos and key not in seen}
     
-    def already_responded(self, issue):
+    def already_responded(self, item):
         """Check if we already responded to this issue"""
-        for comment in issue.get_comments():
-            if 'WooCommerce Sync Coordinator' in comment.body:
-                return True
-        return False
+        key = (item['repo'], item['number'])
+        if key in self.responded:
+            return True
+        if item['responded']:
+            self.responded.add(key)
+            self.failed.discard(key)
+        return item['responded']
+    
+    def load_responded(self):
+        """Load the responded and failed issue sets, starting empty if the cache is missing or unreadable"""
+        try:
+            with open(RESPONDED_CACHE, 'rb') as f:
+                cache = orjson.loads(f.read())
+            if isinstance(cache, list):
+                # Older caches hold only the responded pairs
+                cache = {'responded': cache}
+            return ({tuple(entry) for entry in cache.get('responded', [])},
+                    {tuple(entry) for entry in cache.get('failed', [])})
+        except FileNotFoundError:
+            return set(), set()
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable responded cache {RESPONDED_CACHE}: {str(e)}")
+            return set(), set()
+    
+    def save_responded(self):
+        """Write the responded-issue cache, replacing the old file atomically"""
+        tmp_path = RESPONDED_CACHE + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps({'responded': sorted(self.responded),
+                                  'failed': sorted(self.failed)}))
+        os.replace(tmp_path, RESPONDED_CACHE)
 
 def main():
     """Main entry point"""
     agent = WooCommerceSyncCoordinator()
     logger.info("WooCommerce Sync Coordinator starting - Managing e-commerce integration")
-    agent.process_issues()
+    asyncio.run(agent.process_issues())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file